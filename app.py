@@ -1,122 +1,81 @@
 import streamlit as st
-import plotly.graph_objects as go
-import pandas as pd
-import math
-
-st.set_page_config(layout="wide")
-
-st.markdown("""
-<style>
-.main-title { font-size:34px; font-weight:700; }
-.section-title { font-size:22px; font-weight:600; margin-top:30px; }
-.highlight { font-size:20px; font-weight:600; }
-</style>
-""", unsafe_allow_html=True)
+from tco_core import (
+    setup_page, tco, fmt_money, COVERAGE_CHOICES, SLA_CHOICES, WifiStack, P5GStack,
+    CAPEX_COLUMNS, make_capex_df
+)
 
-st.markdown('<div class="main-title">🏛 Enterprise Wireless Full-Stack Investment Model</div>', unsafe_allow_html=True)
+setup_page("🏛 Enterprise Wireless Full-Stack Investment Model")
 
 # ============================================================
 # SIDEBAR – STRATEGIC INPUTS
 # ============================================================
 
-st.sidebar.header("🏢 Strategic Parameters")
+# Sidebar edits are applied together on "Recompute" instead of one rerun per widget.
+params = st.sidebar.form("params")
 
-sqft = st.sidebar.number_input("Facility Size (sqft)", min_value=1000.0, value=500000.0)
-years = st.sidebar.slider("Investment Horizon (Years)", 3, 10, 5)
+params.header("🏢 Strategic Parameters")
 
-coverage = st.sidebar.selectbox(
-    "Coverage Model",
-    ["Indoor Only", "Outdoor Only", "Indoor + Outdoor"]
-)
+sqft = params.number_input("Facility Size (sqft)", min_value=1000.0, value=500000.0)
+years = params.slider("Investment Horizon (Years)", 3, 10, 5)
+discount_rate = params.slider("NPV Discount Rate (%/yr)", 0, 15, 0) / 100
+
+coverage = params.selectbox("Coverage Model", COVERAGE_CHOICES)
 
-growth = st.sidebar.slider("Annual Device Growth (%)", 0, 30, 10)
-latency = st.sidebar.slider("Latency Requirement (ms)", 1, 50, 15)
-sla = st.sidebar.selectbox("Availability Target", ["99.9%","99.99%","99.999%"])
+growth = params.slider("Annual Device Growth (%)", 0, 30, 10)
+latency = params.slider("Latency Requirement (ms)", 1, 50, 15)
+sla = params.selectbox("Availability Target", SLA_CHOICES)
 
 # ============================================================
 # Wi-Fi STACK
 # ============================================================
 
-st.sidebar.markdown("---")
-st.sidebar.header("📶 Wi-Fi Stack")
+params.markdown("---")
+params.header("📶 Wi-Fi Stack")
 
-wifi_ap_cost = st.sidebar.number_input("Access Point Cost ($)", min_value=0.0, value=1200.0)
-wifi_switch_cost = st.sidebar.number_input("Access Switch Cost ($)", min_value=0.0, value=8000.0)
-wifi_controller_cost = st.sidebar.number_input("Controller/Core Cost ($)", min_value=0.0, value=50000.0)
+wifi_ap_cost = params.number_input("Access Point Cost ($)", min_value=0.0, value=1200.0)
+wifi_switch_cost = params.number_input("Access Switch Cost ($)", min_value=0.0, value=8000.0)
+wifi_controller_cost = params.number_input("Controller/Core Cost ($)", min_value=0.0, value=50000.0)
 
-wifi_install_percent = st.sidebar.slider("Installation (%)", 0, 30, 15) / 100
-wifi_maint = st.sidebar.slider("Maintenance (%)", 0, 30, 18) / 100
-wifi_discount = st.sidebar.slider("Wi-Fi Discount (%)", 0, 50, 0) / 100
+wifi_install_percent = params.slider("Installation (%)", 0, 30, 15) / 100
+wifi_maint = params.slider("Maintenance (%)", 0, 30, 18) / 100
+wifi_discount = params.slider("Wi-Fi Discount (%)", 0, 50, 0) / 100
 
 # ============================================================
 # PRIVATE 5G STACK
 # ============================================================
 
-st.sidebar.markdown("---")
-st.sidebar.header("📡 Private 5G Stack")
-
-p5g_cell_cost = st.sidebar.number_input("Small Cell Cost ($)", min_value=0.0, value=5000.0)
-p5g_core_cost = st.sidebar.number_input("5G Core Cost ($)", min_value=0.0, value=80000.0)
-p5g_edge_cost = st.sidebar.number_input("Edge Server Cost ($)", min_value=0.0, value=60000.0)
-p5g_backhaul_cost = st.sidebar.number_input("Backhaul Cost ($)", min_value=0.0, value=40000.0)
+params.markdown("---")
+params.header("📡 Private 5G Stack")
 
-p5g_install_percent = st.sidebar.slider("Installation (%)", 0, 30, 12) / 100
-p5g_maint = st.sidebar.slider("Maintenance (%)", 0, 30, 15) / 100
-p5g_discount = st.sidebar.slider("Private 5G Discount (%)", 0, 50, 0) / 100
+p5g_cell_cost = params.number_input("Small Cell Cost ($)", min_value=0.0, value=5000.0)
+p5g_core_cost = params.number_input("5G Core Cost ($)", min_value=0.0, value=80000.0)
+p5g_edge_cost = params.number_input("Edge Server Cost ($)", min_value=0.0, value=60000.0)
+p5g_backhaul_cost = params.number_input("Backhaul Cost ($)", min_value=0.0, value=40000.0)
 
-# ============================================================
-# MULTIPLIERS
-# ============================================================
-
-def sla_multiplier(s):
-    return {"99.9%":1.0,"99.99%":1.08,"99.999%":1.15}[s]
+p5g_install_percent = params.slider("Installation (%)", 0, 30, 12) / 100
+p5g_maint = params.slider("Maintenance (%)", 0, 30, 15) / 100
+p5g_discount = params.slider("Private 5G Discount (%)", 0, 50, 0) / 100
 
-def coverage_multiplier(c):
-    return {"Indoor Only":1.0,"Outdoor Only":1.25,"Indoor + Outdoor":1.15}[c]
-
-def growth_multiplier(g, y):
-    return (1 + g/100) ** y
+params.form_submit_button("Recompute")
 
 # ============================================================
-# Wi-Fi CALCULATION
+# TCO CALCULATION
 # ============================================================
 
-wifi_ap_count = math.ceil((sqft / 2500) * coverage_multiplier(coverage))
-wifi_switch_count = math.ceil(wifi_ap_count / 24)
-
-wifi_access_cost = wifi_ap_count * wifi_ap_cost
-wifi_switch_total = wifi_switch_count * wifi_switch_cost
-wifi_core_total = wifi_controller_cost
-
-wifi_capex_raw = wifi_access_cost + wifi_switch_total + wifi_core_total
-wifi_install_cost = wifi_capex_raw * wifi_install_percent
-wifi_capex_before_discount = wifi_capex_raw + wifi_install_cost
-wifi_capex = wifi_capex_before_discount * (1 - wifi_discount)
-
-wifi_opex = wifi_capex * wifi_maint * years
-wifi_total = (wifi_capex + wifi_opex) * sla_multiplier(sla) * growth_multiplier(growth, years)
-
-if latency < 10:
-    wifi_total *= 1.10
-
-# ============================================================
-# 5G CALCULATION
-# ============================================================
-
-p5g_cell_count = math.ceil((sqft / 10000) * coverage_multiplier(coverage))
-
-p5g_radio_cost = p5g_cell_count * p5g_cell_cost
-p5g_core_total = p5g_core_cost
-p5g_edge_total = p5g_edge_cost
-p5g_backhaul_total = p5g_backhaul_cost
+wifi_stack = WifiStack(
+    wifi_ap_cost, wifi_switch_cost, wifi_controller_cost,
+    wifi_install_percent, wifi_maint, wifi_discount
+)
+p5g_stack = P5GStack(
+    p5g_cell_cost, p5g_core_cost, p5g_edge_cost, p5g_backhaul_cost,
+    p5g_install_percent, p5g_maint, p5g_discount
+)
 
-p5g_capex_raw = p5g_radio_cost + p5g_core_total + p5g_edge_total + p5g_backhaul_total
-p5g_install_cost = p5g_capex_raw * p5g_install_percent
-p5g_capex_before_discount = p5g_capex_raw + p5g_install_cost
-p5g_capex = p5g_capex_before_discount * (1 - p5g_discount)
+res = tco(sqft, years, coverage, growth, latency, sla, wifi_stack, p5g_stack,
+          discount_rate=discount_rate)
 
-p5g_opex = p5g_capex * p5g_maint * years
-p5g_total = (p5g_capex + p5g_opex) * sla_multiplier(sla) * growth_multiplier(growth, years)
+wifi_capex, wifi_total = res.wifi_capex, res.wifi_total
+p5g_capex, p5g_total = res.p5g_capex, res.p5g_total
 
 # ============================================================
 # EXECUTIVE OVERVIEW
@@ -125,8 +84,8 @@ p5g_total = (p5g_capex + p5g_opex) * sla_multiplier(sla) * growth_multiplier(gro
 st.markdown('<div class="section-title">1️⃣ Executive Financial Overview</div>', unsafe_allow_html=True)
 
 c1, c2 = st.columns(2)
-c1.metric("Wi-Fi 5Y TCO", f"${wifi_total:,.0f}")
-c2.metric("Private 5G 5Y TCO", f"${p5g_total:,.0f}")
+c1.metric("Wi-Fi 5Y TCO", fmt_money(wifi_total))
+c2.metric("Private 5G 5Y TCO", fmt_money(p5g_total))
 
 # ============================================================
 # CAPEX DIFFERENCE SUMMARY
@@ -154,46 +113,10 @@ else:
 
 st.markdown('<div class="section-title">3️⃣ CAPEX Composition Breakdown</div>', unsafe_allow_html=True)
 
-capex_data = {
-    "Component": [
-        "Wi-Fi Access Points",
-        "Wi-Fi Switches",
-        "Wi-Fi Controller/Core",
-        "Wi-Fi Installation",
-        "Private 5G Small Cells",
-        "Private 5G Core",
-        "Private 5G Edge Server",
-        "Private 5G Backhaul",
-        "Private 5G Installation"
-    ],
-    "Wi-Fi ($)": [
-        wifi_access_cost,
-        wifi_switch_total,
-        wifi_core_total,
-        wifi_install_cost,
-        0, 0, 0, 0, 0
-    ],
-    "Private 5G ($)": [
-        0, 0, 0, 0,
-        p5g_radio_cost,
-        p5g_core_total,
-        p5g_edge_total,
-        p5g_backhaul_total,
-        p5g_install_cost
-    ]
-}
-
-capex_df = pd.DataFrame(capex_data)
-
-totals = pd.DataFrame({
-    "Component": ["TOTAL (After Discount)"],
-    "Wi-Fi ($)": [wifi_capex],
-    "Private 5G ($)": [p5g_capex]
-})
-
-capex_df = pd.concat([capex_df, totals], ignore_index=True)
-
-st.dataframe(capex_df, use_container_width=True)
+capex_df = make_capex_df(res, "TOTAL (After Discount)")
+
+st.dataframe(capex_df, width="stretch", hide_index=True,
+             column_config=CAPEX_COLUMNS)
 
 # ============================================================
 # CAPEX GRAPH
@@ -201,9 +124,7 @@ st.dataframe(capex_df, use_container_width=True)
 
 st.markdown('<div class="section-title">4️⃣ Total CAPEX Comparison</div>', unsafe_allow_html=True)
 
-fig_capex = go.Figure()
-fig_capex.add_trace(go.Bar(name="Wi-Fi", x=["CAPEX"], y=[wifi_capex]))
-fig_capex.add_trace(go.Bar(name="Private 5G", x=["CAPEX"], y=[p5g_capex]))
-
-fig_capex.update_layout(barmode="group", template="plotly_white")
-st.plotly_chart(fig_capex, use_container_width=True)
\ No newline at end of file
+st.bar_chart(
+    {"Architecture": ["Wi-Fi", "Private 5G"], "CAPEX": [wifi_capex, p5g_capex]},
+    x="Architecture", y="CAPEX", sort=False
+)
\ No newline at end of file
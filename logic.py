@@ -1,123 +1,82 @@
 import streamlit as st
-import plotly.graph_objects as go
-import pandas as pd
-import math
-
-st.set_page_config(layout="wide")
-
-st.markdown("""
-<style>
-.main-title { font-size:34px; font-weight:700; }
-.section-title { font-size:22px; font-weight:600; margin-top:30px; }
-</style>
-""", unsafe_allow_html=True)
+import numpy as np
+from tco_core import (
+    setup_page, tco, compute_tco_grid, annuity_factor, fmt_money, COVERAGE_CHOICES, SLA_CHOICES,
+    WifiStack, P5GStack, STATIC_CHART, CAPEX_COLUMNS, make_bar_fig, make_capex_df, make_trend_fig,
+    make_heatmap_fig
+)
 
-st.markdown('<div class="main-title">🏛 Enterprise Wireless Full-Stack Investment Model</div>', unsafe_allow_html=True)
+setup_page("🏛 Enterprise Wireless Full-Stack Investment Model")
 
 # ============================================================
 # SIDEBAR – STRATEGIC INPUTS
 # ============================================================
 
-st.sidebar.header("🏢 Strategic Parameters")
+# Sidebar edits are applied together on "Recompute" instead of one rerun per widget.
+params = st.sidebar.form("params")
 
-sqft = st.sidebar.number_input("Facility Size (sqft)", 1000, 10000000, 500000, 10000)
-years = st.sidebar.slider("Investment Horizon (Years)", 3, 10, 5)
+params.header("🏢 Strategic Parameters")
 
-coverage = st.sidebar.selectbox(
-    "Coverage Model",
-    ["Indoor Only", "Outdoor Only", "Indoor + Outdoor"]
-)
+sqft = params.number_input("Facility Size (sqft)", 1000, 10000000, 500000, 10000)
+years = params.slider("Investment Horizon (Years)", 3, 10, 5)
+discount_rate = params.slider("NPV Discount Rate (%/yr)", 0, 15, 0) / 100
+
+coverage = params.selectbox("Coverage Model", COVERAGE_CHOICES)
 
-growth = st.sidebar.slider("Annual Device Growth (%)", 0, 30, 10)
-latency = st.sidebar.slider("Latency Requirement (ms)", 1, 50, 15)
-sla = st.sidebar.selectbox("Availability Target", ["99.9%","99.99%","99.999%"])
+growth = params.slider("Annual Device Growth (%)", 0, 30, 10)
+latency = params.slider("Latency Requirement (ms)", 1, 50, 15)
+sla = params.selectbox("Availability Target", SLA_CHOICES)
 
 # ============================================================
 # Wi-Fi STACK
 # ============================================================
 
-st.sidebar.markdown("---")
-st.sidebar.header("📶 Wi-Fi Stack")
+params.markdown("---")
+params.header("📶 Wi-Fi Stack")
 
-wifi_ap_cost = st.sidebar.number_input("Access Point Cost ($)", 500, 5000, 1200)
-wifi_switch_cost = st.sidebar.number_input("Access Switch Cost ($)", 2000, 20000, 8000)
-wifi_controller_cost = st.sidebar.number_input("Controller/Core Cost ($)", 10000, 200000, 50000)
-wifi_install_percent = st.sidebar.slider("Installation (%)", 5, 30, 15) / 100
-wifi_maint = st.sidebar.slider("Maintenance (%)", 5, 30, 18) / 100
+wifi_ap_cost = params.number_input("Access Point Cost ($)", 500, 5000, 1200)
+wifi_switch_cost = params.number_input("Access Switch Cost ($)", 2000, 20000, 8000)
+wifi_controller_cost = params.number_input("Controller/Core Cost ($)", 10000, 200000, 50000)
+wifi_install_percent = params.slider("Installation (%)", 5, 30, 15) / 100
+wifi_maint = params.slider("Maintenance (%)", 5, 30, 18) / 100
 
 # ============================================================
 # PRIVATE 5G STACK
 # ============================================================
 
-st.sidebar.markdown("---")
-st.sidebar.header("📡 Private 5G Stack")
-
-p5g_cell_cost = st.sidebar.number_input("Small Cell Cost ($)", 2000, 10000, 5000)
-p5g_core_cost = st.sidebar.number_input("5G Core Cost ($)", 20000, 200000, 80000)
-p5g_edge_cost = st.sidebar.number_input("Edge Server Cost ($)", 10000, 150000, 60000)
-p5g_backhaul_cost = st.sidebar.number_input("Backhaul Cost ($)", 10000, 200000, 40000)
-p5g_install_percent = st.sidebar.slider("Installation (%)", 5, 30, 12) / 100
-p5g_maint = st.sidebar.slider("Maintenance (%)", 5, 30, 15) / 100
-
-# ============================================================
-# MULTIPLIERS
-# ============================================================
+params.markdown("---")
+params.header("📡 Private 5G Stack")
 
-def sla_multiplier(s):
-    return {"99.9%":1.0,"99.99%":1.08,"99.999%":1.15}[s]
+p5g_cell_cost = params.number_input("Small Cell Cost ($)", 2000, 10000, 5000)
+p5g_core_cost = params.number_input("5G Core Cost ($)", 20000, 200000, 80000)
+p5g_edge_cost = params.number_input("Edge Server Cost ($)", 10000, 150000, 60000)
+p5g_backhaul_cost = params.number_input("Backhaul Cost ($)", 10000, 200000, 40000)
+p5g_install_percent = params.slider("Installation (%)", 5, 30, 12) / 100
+p5g_maint = params.slider("Maintenance (%)", 5, 30, 15) / 100
 
-def coverage_multiplier(c):
-    return {"Indoor Only":1.0,"Outdoor Only":1.25,"Indoor + Outdoor":1.15}[c]
-
-def growth_multiplier(g, y):
-    return (1 + g/100) ** y
+params.form_submit_button("Recompute")
 
 # ============================================================
-# Wi-Fi CALCULATION
+# TCO CALCULATION
 # ============================================================
 
-wifi_ap_count = math.ceil((sqft / 2500) * coverage_multiplier(coverage))
-wifi_switch_count = math.ceil(wifi_ap_count / 24)
-
-wifi_access_cost = wifi_ap_count * wifi_ap_cost
-wifi_switch_total = wifi_switch_count * wifi_switch_cost
-wifi_core_total = wifi_controller_cost
-
-wifi_capex_raw = wifi_access_cost + wifi_switch_total + wifi_core_total
-wifi_install_cost = wifi_capex_raw * wifi_install_percent
-wifi_capex = wifi_capex_raw + wifi_install_cost
-
-wifi_opex = wifi_capex * wifi_maint * years
-wifi_total = (wifi_capex + wifi_opex) * sla_multiplier(sla) * growth_multiplier(growth, years)
-
-if latency < 10:
-    wifi_total *= 1.10
-
-# ============================================================
-# 5G CALCULATION
-# ============================================================
-
-p5g_cell_count = math.ceil((sqft / 10000) * coverage_multiplier(coverage))
-
-p5g_radio_cost = p5g_cell_count * p5g_cell_cost
-p5g_core_total = p5g_core_cost
-p5g_edge_total = p5g_edge_cost
-p5g_backhaul_total = p5g_backhaul_cost
-
-p5g_capex_raw = p5g_radio_cost + p5g_core_total + p5g_edge_total + p5g_backhaul_total
-p5g_install_cost = p5g_capex_raw * p5g_install_percent
-p5g_capex = p5g_capex_raw + p5g_install_cost
-
-p5g_opex = p5g_capex * p5g_maint * years
-p5g_total = (p5g_capex + p5g_opex) * sla_multiplier(sla) * growth_multiplier(growth, years)
+wifi_stack = WifiStack(
+    wifi_ap_cost, wifi_switch_cost, wifi_controller_cost,
+    wifi_install_percent, wifi_maint
+)
+p5g_stack = P5GStack(
+    p5g_cell_cost, p5g_core_cost, p5g_edge_cost, p5g_backhaul_cost,
+    p5g_install_percent, p5g_maint
+)
 
-# ============================================================
-# HYBRID
-# ============================================================
+res = tco(sqft, years, coverage, growth, latency, sla, wifi_stack, p5g_stack,
+          discount_rate=discount_rate)
 
-hyb_capex = (wifi_capex * 0.6) + (p5g_capex * 0.6)
-hyb_opex = (wifi_opex * 0.6) + (p5g_opex * 0.6)
-hyb_total = (hyb_capex + hyb_opex) * sla_multiplier(sla) * growth_multiplier(growth, years)
+# One entry per architecture, in chart order.
+ARCHS = ("Wi-Fi", "Private 5G", "Hybrid")
+capex = np.array([res.wifi_capex, res.p5g_capex, res.hyb_capex])
+opex = np.array([res.wifi_opex, res.p5g_opex, res.hyb_opex])
+total = np.array([res.wifi_total, res.p5g_total, res.hyb_total])
 
 # ============================================================
 # EXECUTIVE OVERVIEW
@@ -125,10 +84,8 @@ hyb_total = (hyb_capex + hyb_opex) * sla_multiplier(sla) * growth_multiplier(gro
 
 st.markdown('<div class="section-title">1️⃣ Executive Financial Overview</div>', unsafe_allow_html=True)
 
-c1, c2, c3 = st.columns(3)
-c1.metric("Wi-Fi 5Y TCO", f"${wifi_total:,.0f}")
-c2.metric("Private 5G 5Y TCO", f"${p5g_total:,.0f}")
-c3.metric("Hybrid 5Y TCO", f"${hyb_total:,.0f}")
+for col, arch, arch_total in zip(st.columns(3), ARCHS, total):
+    col.metric(f"{arch} 5Y TCO", fmt_money(arch_total))
 
 # ============================================================
 # CAPEX COMPOSITION TABLE
@@ -136,84 +93,54 @@ c3.metric("Hybrid 5Y TCO", f"${hyb_total:,.0f}")
 
 st.markdown('<div class="section-title">2️⃣ CAPEX Composition Breakdown</div>', unsafe_allow_html=True)
 
-capex_data = {
-    "Component": [
-        "Wi-Fi Access Points",
-        "Wi-Fi Switches",
-        "Wi-Fi Controller/Core",
-        "Wi-Fi Installation",
-        "Private 5G Small Cells",
-        "Private 5G Core",
-        "Private 5G Edge Server",
-        "Private 5G Backhaul",
-        "Private 5G Installation"
-    ],
-    "Wi-Fi ($)": [
-        wifi_access_cost,
-        wifi_switch_total,
-        wifi_core_total,
-        wifi_install_cost,
-        0, 0, 0, 0, 0
-    ],
-    "Private 5G ($)": [
-        0, 0, 0, 0,
-        p5g_radio_cost,
-        p5g_core_total,
-        p5g_edge_total,
-        p5g_backhaul_total,
-        p5g_install_cost
-    ]
-}
+capex_df = make_capex_df(res, "TOTAL")
 
-capex_df = pd.DataFrame(capex_data)
+st.dataframe(capex_df, width="stretch", hide_index=True,
+             column_config=CAPEX_COLUMNS)
 
-totals = pd.DataFrame({
-    "Component": ["TOTAL"],
-    "Wi-Fi ($)": [wifi_capex],
-    "Private 5G ($)": [p5g_capex]
-})
+# ============================================================
+# CAPEX & OPEX COMPARISON
+# ============================================================
 
-capex_df = pd.concat([capex_df, totals], ignore_index=True)
+st.markdown('<div class="section-title">3️⃣ CAPEX & OPEX Comparison</div>', unsafe_allow_html=True)
 
-st.dataframe(capex_df, use_container_width=True)
+fig_cost = make_bar_fig(ARCHS, (("CAPEX", capex), ("OPEX", opex)))
+st.plotly_chart(fig_cost, width="stretch", config=STATIC_CHART)
 
 # ============================================================
-# TOTAL CAPEX COMPARISON
+# INVESTMENT TREND
 # ============================================================
 
-st.markdown('<div class="section-title">3️⃣ Total CAPEX Comparison</div>', unsafe_allow_html=True)
+st.markdown('<div class="section-title">4️⃣ Investment Trend (Cumulative)</div>', unsafe_allow_html=True)
 
-fig_capex = go.Figure()
+years_arr = np.arange(1, years+1)
+annuity_arr = annuity_factor(discount_rate, years_arr)
 
-fig_capex.add_trace(go.Bar(name="Wi-Fi", x=["CAPEX"], y=[wifi_capex]))
-fig_capex.add_trace(go.Bar(name="Private 5G", x=["CAPEX"], y=[p5g_capex]))
-fig_capex.add_trace(go.Bar(name="Hybrid", x=["CAPEX"], y=[hyb_capex]))
+# Spread each architecture's horizon OPEX over the years by its share of the annuity.
+trend = capex[:, None] + opex[:, None] * (annuity_arr / annuity_arr[-1])
 
-fig_capex.update_layout(barmode="group", template="plotly_white")
-st.plotly_chart(fig_capex, use_container_width=True)
+fig_trend = make_trend_fig(years_arr, tuple(zip(ARCHS, trend)))
+st.plotly_chart(fig_trend, width="stretch", config=STATIC_CHART)
 
 # ============================================================
-# INVESTMENT TREND
+# SENSITIVITY SWEEP
 # ============================================================
 
-st.markdown('<div class="section-title">4️⃣ Investment Trend (Cumulative)</div>', unsafe_allow_html=True)
-
-years_list = list(range(1, years+1))
-
-wifi_trend = [wifi_capex + wifi_capex*wifi_maint*y for y in years_list]
-p5g_trend = [p5g_capex + p5g_capex*p5g_maint*y for y in years_list]
-hyb_trend = [hyb_capex + hyb_capex*wifi_maint*y for y in years_list]
+st.markdown('<div class="section-title">5️⃣ Premium over Wi-Fi (Size × Horizon)</div>', unsafe_allow_html=True)
 
-fig_trend = go.Figure()
+@st.fragment
+def render_sensitivity(sqft, coverage, growth, latency, sla, wifi_stack, p5g_stack, discount_rate):
+    arch = st.radio("Compare Against Wi-Fi", ("Private 5G", "Hybrid"), horizontal=True)
 
-fig_trend.add_trace(go.Scatter(x=years_list, y=wifi_trend,
-                               mode='lines+markers', name='Wi-Fi'))
+    sweep_sqft = np.linspace(0.25, 2.0, 8) * sqft
+    sweep_years = np.arange(3, 11)
 
-fig_trend.add_trace(go.Scatter(x=years_list, y=p5g_trend,
-                               mode='lines+markers', name='Private 5G'))
+    grid = compute_tco_grid(sweep_sqft, sweep_years, coverage, growth, latency, sla,
+                            wifi_stack, p5g_stack, discount_rate=discount_rate)
+    premium = (grid.p5g_total if arch == "Private 5G" else grid.hyb_total) - grid.wifi_total
 
-fig_trend.add_trace(go.Scatter(x=years_list, y=hyb_trend,
-                               mode='lines+markers', name='Hybrid'))
+    fig_sweep = make_heatmap_fig(sweep_years, sweep_sqft, premium,
+                                 "Investment Horizon (Years)", "Facility Size (sqft)")
+    st.plotly_chart(fig_sweep, width="stretch")
 
-fig_trend.update_layout(template="plotly_white")
-st.plotly_chart(fig_trend, use_container_width=True)
\ No newline at end of file
+render_sensitivity(sqft, coverage, growth, latency, sla, wifi_stack, p5g_stack, discount_rate)
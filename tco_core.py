@@ -0,0 +1,281 @@
+import streamlit as st
+import numpy as np
+import pandas as pd
+from functools import lru_cache
+from typing import NamedTuple
+
+# ============================================================
+# PAGE STYLE
+# ============================================================
+
+_CSS = """
+<style>
+.main-title { font-size:34px; font-weight:700; }
+.section-title { font-size:22px; font-weight:600; margin-top:30px; }
+.highlight { font-size:20px; font-weight:600; }
+</style>
+"""
+
+def setup_page(title):
+    st.set_page_config(layout="wide")
+    st.markdown(_CSS + f'<div class="main-title">{title}</div>', unsafe_allow_html=True)
+
+# ============================================================
+# MULTIPLIERS
+# ============================================================
+
+_SLA_MULT = {"99.9%":1.0,"99.99%":1.08,"99.999%":1.15}
+
+# Coverage multipliers (1.0, 1.25, 1.15) in integer percent.
+_COVERAGE_PCT = {"Indoor Only":100,"Outdoor Only":125,"Indoor + Outdoor":115}
+
+SLA_CHOICES = tuple(_SLA_MULT)
+
+COVERAGE_CHOICES = tuple(_COVERAGE_PCT)
+
+@lru_cache(maxsize=512)
+def growth_multiplier(g, y):
+    return (1.0 + g/100.0) ** y
+
+def annuity_factor(r, y):
+    if r == 0:
+        return y * 1.0
+    return (1 - (1 + r) ** -y) / r
+
+def _ceil_div(a, b):
+    return -(-a // b)
+
+# Sqft per AP / small cell, scaled by the percent denominator.
+_AP_SQFT_PCT = 2500 * 100
+_CELL_SQFT_PCT = 10000 * 100
+
+# ============================================================
+# TCO CALCULATION
+# ============================================================
+
+class WifiStack(NamedTuple):
+    ap_cost: float
+    switch_cost: float
+    controller_cost: float
+    install_percent: float
+    maint: float
+    discount: float = 0.0
+
+class P5GStack(NamedTuple):
+    cell_cost: float
+    core_cost: float
+    edge_cost: float
+    backhaul_cost: float
+    install_percent: float
+    maint: float
+    discount: float = 0.0
+
+class TCOResult(NamedTuple):
+    wifi_access_cost: float
+    wifi_switch_total: float
+    wifi_core_total: float
+    wifi_install_cost: float
+    wifi_capex: float
+    wifi_opex: float
+    wifi_total: float
+    p5g_radio_cost: float
+    p5g_core_total: float
+    p5g_edge_total: float
+    p5g_backhaul_total: float
+    p5g_install_cost: float
+    p5g_capex: float
+    p5g_opex: float
+    p5g_total: float
+    hyb_capex: float
+    hyb_opex: float
+    hyb_total: float
+
+def hybrid(w_capex, w_opex, p_capex, p_opex):
+    return (w_capex * 0.6) + (p_capex * 0.6), (w_opex * 0.6) + (p_opex * 0.6)
+
+def _tco_kernel(sqft, annuity, cov_pct, scale, lat_m, wifi, p5g):
+
+    # Operators only, so every argument may be a scalar or a NumPy array.
+
+    # Wi-Fi
+    wifi_ap_count = _ceil_div(sqft * cov_pct, _AP_SQFT_PCT)
+    wifi_switch_count = _ceil_div(wifi_ap_count, 24)
+
+    wifi_access_cost = wifi_ap_count * wifi.ap_cost
+    wifi_switch_total = wifi_switch_count * wifi.switch_cost
+    wifi_core_total = wifi.controller_cost
+
+    wifi_capex_raw = wifi_access_cost + wifi_switch_total + wifi_core_total
+    wifi_install_cost = wifi_capex_raw * wifi.install_percent
+    wifi_capex_before_discount = wifi_capex_raw + wifi_install_cost
+    wifi_capex = wifi_capex_before_discount * (1 - wifi.discount)
+
+    wifi_opex = wifi_capex * wifi.maint * annuity
+    wifi_total = (wifi_capex + wifi_opex) * scale * lat_m
+
+    # Private 5G
+    p5g_cell_count = _ceil_div(sqft * cov_pct, _CELL_SQFT_PCT)
+
+    p5g_radio_cost = p5g_cell_count * p5g.cell_cost
+    p5g_core_total = p5g.core_cost
+    p5g_edge_total = p5g.edge_cost
+    p5g_backhaul_total = p5g.backhaul_cost
+
+    p5g_capex_raw = p5g_radio_cost + p5g_core_total + p5g_edge_total + p5g_backhaul_total
+    p5g_install_cost = p5g_capex_raw * p5g.install_percent
+    p5g_capex_before_discount = p5g_capex_raw + p5g_install_cost
+    p5g_capex = p5g_capex_before_discount * (1 - p5g.discount)
+
+    p5g_opex = p5g_capex * p5g.maint * annuity
+    p5g_total = (p5g_capex + p5g_opex) * scale
+
+    # Hybrid
+    hyb_capex, hyb_opex = hybrid(wifi_capex, wifi_opex, p5g_capex, p5g_opex)
+    hyb_total = (hyb_capex + hyb_opex) * scale
+
+    return TCOResult(
+        wifi_access_cost,
+        wifi_switch_total,
+        wifi_core_total,
+        wifi_install_cost,
+        wifi_capex,
+        wifi_opex,
+        wifi_total,
+        p5g_radio_cost,
+        p5g_core_total,
+        p5g_edge_total,
+        p5g_backhaul_total,
+        p5g_install_cost,
+        p5g_capex,
+        p5g_opex,
+        p5g_total,
+        hyb_capex,
+        hyb_opex,
+        hyb_total
+    )
+
+@st.cache_data(max_entries=512, show_spinner=False)
+def compute_all_tco(sqft, years, coverage, growth, latency, sla, wifi, p5g, discount_rate=0.0):
+
+    annuity = annuity_factor(discount_rate, years)
+    scale = _SLA_MULT[sla] * growth_multiplier(growth, years)
+    cov_pct = _COVERAGE_PCT[coverage]
+    lat_m = 1.0 + 0.10 * (latency < 10)
+
+    return _tco_kernel(sqft, annuity, cov_pct, scale, lat_m, wifi, p5g)
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def compute_tco_grid(sqft_values, years_values, coverage, growth, latency, sla, wifi, p5g,
+                     discount_rate=0.0):
+
+    # Broadcast facility size down the rows and horizon across the columns.
+    sqft_grid = np.asarray(sqft_values, dtype=float)[:, None]
+    years_grid = np.asarray(years_values, dtype=float)[None, :]
+
+    annuity = annuity_factor(discount_rate, years_grid)
+    scale = _SLA_MULT[sla] * (1.0 + growth/100.0) ** years_grid
+    cov_pct = _COVERAGE_PCT[coverage]
+    lat_m = 1.0 + 0.10 * (latency < 10)
+
+    return _tco_kernel(sqft_grid, annuity, cov_pct, scale, lat_m, wifi, p5g)
+
+def tco(*args, **kwargs):
+    tco_key = (args, tuple(sorted(kwargs.items())))
+
+    if st.session_state.get("_tco_key") == tco_key:
+        return st.session_state["_tco_vals"]
+
+    tco_vals = compute_all_tco(*args, **kwargs)
+    st.session_state["_tco_key"] = tco_key
+    st.session_state["_tco_vals"] = tco_vals
+    return tco_vals
+
+# ============================================================
+# FORMATTING
+# ============================================================
+
+@lru_cache(maxsize=2048)
+def _fmt_money(v):
+    return f"${v:,.0f}"
+
+def fmt_money(v):
+    return _fmt_money(round(v))
+
+# ============================================================
+# TABLES
+# ============================================================
+
+# Formatted client-side, so the columns stay numeric and sort as numbers.
+CAPEX_COLUMNS = {
+    col: st.column_config.NumberColumn(format="dollar", step=1)
+    for col in ("Wi-Fi ($)", "Private 5G ($)")
+}
+
+@st.cache_data(max_entries=512, show_spinner=False)
+def make_capex_df(res, total_label):
+    return pd.DataFrame({
+        "Component": [
+            "Wi-Fi Access Points",
+            "Wi-Fi Switches",
+            "Wi-Fi Controller/Core",
+            "Wi-Fi Installation",
+            "Private 5G Small Cells",
+            "Private 5G Core",
+            "Private 5G Edge Server",
+            "Private 5G Backhaul",
+            "Private 5G Installation",
+            total_label
+        ],
+        "Wi-Fi ($)": [
+            res.wifi_access_cost,
+            res.wifi_switch_total,
+            res.wifi_core_total,
+            res.wifi_install_cost,
+            0, 0, 0, 0, 0,
+            res.wifi_capex
+        ],
+        "Private 5G ($)": [
+            0, 0, 0, 0,
+            res.p5g_radio_cost,
+            res.p5g_core_total,
+            res.p5g_edge_total,
+            res.p5g_backhaul_total,
+            res.p5g_install_cost,
+            res.p5g_capex
+        ]
+    })
+
+# ============================================================
+# CHARTS
+# ============================================================
+
+# Read-only summary charts skip Plotly's hover/zoom handlers and toolbar.
+STATIC_CHART = {"staticPlot": True, "displayModeBar": False}
+
+@st.cache_resource(max_entries=64)
+def make_bar_fig(categories, series):
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    for name, ys in series:
+        fig.add_trace(go.Bar(name=name, x=list(categories), y=list(ys)))
+    fig.update_layout(barmode="group", template="plotly_white")
+    return fig
+
+@st.cache_resource(max_entries=64)
+def make_trend_fig(x, series):
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    for name, ys in series:
+        fig.add_trace(go.Scatter(x=x, y=ys, mode='lines+markers', name=name))
+    fig.update_layout(template="plotly_white")
+    return fig
+
+@st.cache_resource(max_entries=64)
+def make_heatmap_fig(x, y, z, x_title, y_title):
+    import plotly.graph_objects as go
+
+    fig = go.Figure(go.Heatmap(x=x, y=y, z=z, colorscale="RdBu_r", zmid=0))
+    fig.update_layout(template="plotly_white", xaxis_title=x_title, yaxis_title=y_title)
+    return fig
@@ -0,0 +1,101 @@
+import math
+import random
+
+import numpy as np
+import pytest
+
+from tco_core import (
+    _COVERAGE_PCT, _AP_SQFT_PCT, _CELL_SQFT_PCT, _ceil_div, annuity_factor,
+    compute_all_tco, compute_tco_grid, COVERAGE_CHOICES, SLA_CHOICES, WifiStack, P5GStack
+)
+
+# Defaults of the sidebar inputs on both pages.
+WIFI = WifiStack(1200.0, 8000.0, 50000.0, 0.15, 0.18)
+P5G = P5GStack(5000.0, 80000.0, 60000.0, 40000.0, 0.12, 0.15)
+
+# ============================================================
+# BASELINE MODEL
+# ============================================================
+
+# The original float formulas, before the calculation moved into tco_core.
+_BASELINE_SLA = {"99.9%":1.0,"99.99%":1.08,"99.999%":1.15}
+_BASELINE_COVERAGE = {"Indoor Only":1.0,"Outdoor Only":1.25,"Indoor + Outdoor":1.15}
+
+def baseline_tco(sqft, years, coverage, growth, latency, sla, wifi, p5g):
+    cov_m = _BASELINE_COVERAGE[coverage]
+    scale = _BASELINE_SLA[sla] * (1 + growth/100) ** years
+
+    wifi_ap_count = math.ceil((sqft / 2500) * cov_m)
+    wifi_switch_count = math.ceil(wifi_ap_count / 24)
+    wifi_capex_raw = wifi_ap_count * wifi.ap_cost + wifi_switch_count * wifi.switch_cost + wifi.controller_cost
+    wifi_capex = (wifi_capex_raw + wifi_capex_raw * wifi.install_percent) * (1 - wifi.discount)
+    wifi_opex = wifi_capex * wifi.maint * years
+    wifi_total = (wifi_capex + wifi_opex) * scale
+    if latency < 10:
+        wifi_total *= 1.10
+
+    p5g_cell_count = math.ceil((sqft / 10000) * cov_m)
+    p5g_capex_raw = p5g_cell_count * p5g.cell_cost + p5g.core_cost + p5g.edge_cost + p5g.backhaul_cost
+    p5g_capex = (p5g_capex_raw + p5g_capex_raw * p5g.install_percent) * (1 - p5g.discount)
+    p5g_opex = p5g_capex * p5g.maint * years
+    p5g_total = (p5g_capex + p5g_opex) * scale
+
+    hyb_capex = (wifi_capex * 0.6) + (p5g_capex * 0.6)
+    hyb_opex = (wifi_opex * 0.6) + (p5g_opex * 0.6)
+    hyb_total = (hyb_capex + hyb_opex) * scale
+
+    return wifi_total, p5g_total, hyb_total
+
+# ============================================================
+# TESTS
+# ============================================================
+
+@pytest.mark.parametrize("coverage", COVERAGE_CHOICES)
+def test_integer_counts_match_float_ceil(coverage):
+    cov_m = _BASELINE_COVERAGE[coverage]
+    cov_pct = _COVERAGE_PCT[coverage]
+    for sqft in range(1000, 10000001, 97):
+        assert _ceil_div(sqft * cov_pct, _AP_SQFT_PCT) == math.ceil((sqft / 2500) * cov_m)
+        assert _ceil_div(sqft * cov_pct, _CELL_SQFT_PCT) == math.ceil((sqft / 10000) * cov_m)
+
+@pytest.mark.parametrize("r", (0.0, 0.01, 0.05, 0.15))
+def test_annuity_factor_matches_explicit_sum(r):
+    years = np.arange(1, 11)
+    expected = [sum((1 + r) ** -t for t in range(1, y + 1)) for y in years]
+    for y, want in zip(years, expected):
+        assert annuity_factor(r, int(y)) == pytest.approx(want, rel=1e-12)
+    assert annuity_factor(r, years) == pytest.approx(expected, rel=1e-12)
+
+def test_grid_matches_scalar_evaluation():
+    sweep_sqft = np.linspace(0.25, 2.0, 8) * 500000
+    sweep_years = np.arange(3, 11)
+    args = ("Indoor + Outdoor", 10, 5, "99.99%", WIFI._replace(discount=0.1), P5G)
+
+    grid = compute_tco_grid(sweep_sqft, sweep_years, *args, discount_rate=0.07)
+    for i, sqft in enumerate(sweep_sqft):
+        for j, years in enumerate(sweep_years):
+            cell = compute_all_tco(float(sqft), int(years), *args, discount_rate=0.07)
+            for field, value in zip(grid._fields, grid):
+                assert np.broadcast_to(value, (8, 8))[i, j] == pytest.approx(getattr(cell, field), rel=1e-12)
+
+def test_default_totals():
+    res = compute_all_tco(500000.0, 5, "Indoor Only", 10, 15, "99.9%", WIFI, P5G)
+    assert res.wifi_capex == pytest.approx(416300.0)
+    assert res.p5g_capex == pytest.approx(481600.0)
+    assert res.wifi_total == pytest.approx(790970.0 * 1.1 ** 5)
+    assert res.p5g_total == pytest.approx(842800.0 * 1.1 ** 5)
+    assert res.hyb_total == pytest.approx(980262.0 * 1.1 ** 5)
+
+def test_matches_baseline_formulas():
+    rng = random.Random(0)
+    for _ in range(2000):
+        wifi = WifiStack(rng.uniform(500, 5000), rng.uniform(2000, 20000), rng.uniform(10000, 200000),
+                         rng.randint(0, 30) / 100, rng.randint(0, 30) / 100, rng.randint(0, 50) / 100)
+        p5g = P5GStack(rng.uniform(2000, 10000), rng.uniform(20000, 200000), rng.uniform(10000, 150000),
+                       rng.uniform(10000, 200000), rng.randint(0, 30) / 100, rng.randint(0, 30) / 100,
+                       rng.randint(0, 50) / 100)
+        inputs = (float(rng.randint(1000, 10000000)), rng.randint(3, 10), rng.choice(COVERAGE_CHOICES),
+                  rng.randint(0, 30), rng.randint(1, 50), rng.choice(SLA_CHOICES), wifi, p5g)
+
+        res = compute_all_tco(*inputs)
+        assert (res.wifi_total, res.p5g_total, res.hyb_total) == pytest.approx(baseline_tco(*inputs), rel=1e-12)